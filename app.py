@@ -1,28 +1,83 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import io
+import logging
+import os
 import re
+import shutil
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from openpyxl import Workbook
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Border, Side
 from openpyxl.utils import get_column_letter
 
+pd.set_option("mode.copy_on_write", True)
 
 BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_FILE = BASE_DIR / "order_status_with_leadtime.xlsx"
 ISSUE_TRACKER_PATH = BASE_DIR / "issue_tracker.xlsx"
+SNAPSHOT_DIR = BASE_DIR / ".snapshots"
+SNAPSHOT_VERSION = 6
+SNAPSHOT_ENABLED = importlib.util.find_spec("pyarrow") is not None
+UPLOAD_CACHE_MAX_ENTRIES = 8
+UPLOAD_CACHE_MAX_BYTES = 512 * 1024 * 1024
+UPLOAD_CACHE_TTL = 60 * 60
+SEARCH_CACHE_MAX_ENTRIES = 256
+SEARCH_CACHE_MAX_BYTES = 32 * 1024 * 1024
+SEARCH_CACHE_TTL = 30 * 60
+SEARCH_REFINE_ROWS = 20_000
+SELECTION_CACHE_MAX_ENTRIES = 128
+SELECTION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SELECTION_CACHE_TTL = 30 * 60
+SNAPSHOT_LOCK_TIMEOUT = 10 * 60
+SNAPSHOT_LOCK_POLL = 0.2
+WATCH_INTERVAL = 30
+
+SHEET_ORDER_STATUS = "order_status"
+SHEET_BY_ITEM = "order_status_by_item"
+SHEET_MONTHLY = "monthly_summary"
+SHEET_LEADTIME = "summary_by_month"
+EAGER_SHEETS = [SHEET_ORDER_STATUS, SHEET_BY_ITEM]
+
+LOGGER = logging.getLogger(__name__)
 
 TAB_ORDER_STATUS = "\uc218\uc8fc \uc9c4\ud589 \uc0c1\uc138"
 TAB_BY_ITEM = "\uc81c\ud488\ubcc4 \uc218\uc8fc \uc9c4\ud589"
 TAB_ISSUES = "\uc0dd\uc0b0 \uc774\uc288 \uad00\ub9ac"
 TAB_PRODUCT_SUMMARY = "\uc81c\ud488 \uc218\uc694 \uc694\uc57d"
 TAB_PRODUCT_MONTHLY = "\uc81c\ud488 \uc6d4\ubcc4 \uc218\uc8fc"
-SEARCH_COL = "__search_key__"
+SEARCH_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+SEARCH_FOLD = re.compile(r"[\W_]+")
+COMMA_SUFFIX = re.compile(
+    r",\s*(?:co\.?\s*,\s*ltd|co\.?\s*ltd|ltd|inc|corp|llc|plc|gmbh|sa|srl|bv|kg)\.?"
+)
+CORPORATE_SUFFIX = re.compile(
+    r"\(\uc8fc\)|\u3231|\uc8fc\uc2dd\ud68c\uc0ac"
+    r"|(?:[\s,.]+(?:co|ltd|inc|corp|llc|plc|gmbh|sa|srl|bv|kg)\.?)+$"
+)
+CHOSUNG = (
+    "\u3131\u3132\u3134\u3137\u3138\u3139\u3141\u3142\u3143\u3145"
+    "\u3146\u3147\u3148\u3149\u314a\u314b\u314c\u314d\u314e"
+)
+CHOSUNG_TABLE = {code: CHOSUNG[(code - 0xAC00) // 588] for code in range(0xAC00, 0xD7A4)}
 MAX_STATUS_STYLE_ROWS = 2000
 ISSUE_ROW_HEIGHT = 90
 ISSUE_TABLE_MAX_HEIGHT = 360
@@ -148,14 +203,16 @@ COL_CUSTOMER = "\uace0\uac1d"
 COL_WORKNO = "\uc791\uc9c0\ubc88\ud638"
 COL_PRODUCT = "\ud488\uba85"
 COL_YEAR = "\uc5f0\ub3c4"
-COL_MONTH_DATE = "__month_date__"
+COL_MONTH_KEY = "__month_key__"
 COL_PROD_EXPECT = "\uc0dd\uc0b0\uc644\ub8cc\uc608\uc0c1\uc77c"
 
 COL_ORDER_QTY = "\uc624\ub354\uc218\ub7c9"
 COL_ORDER_AMT = "\uc218\uc8fc\uae08\uc561"
 COL_ORDER_AMT_KRW = "\uc218\uc8fc\uae08\uc561(\uc6d0)"
 COL_ORDER_AMT_USD = "\uc218\uc8fc\uae08\uc561(\ub2ec\ub7ec)"
+COL_CURRENCY = "\ud654\ud3d0"
 COL_LEADTIME = "\ub9ac\ub4dc\ud0c0\uc784(\uc77c)"
+COL_LEADTIME_REVIEW = "\ub9ac\ub4dc\ud0c0\uc784 \uac80\ud1a0"
 
 COL_ORDER_SENT = "\uc218\uc8fc \uc804\uc1a1\uc77c"
 COL_SALES_REQ = "\uc601\uc5c5\ucd9c\uace0\uc694\uccad\uc77c"
@@ -182,6 +239,33 @@ COL_DUE_PLAN = "\ub0a9\uae30\uc900\uc218(\ucd5c\ucd08\ucd9c\uace0\uacc4\ud68d\uc
 COL_DUE_SALES = "\ub0a9\uae30\uc900\uc218(\uc601\uc5c5\ucd9c\uace0\uc694\uccad\uc77c)"
 COL_DUE_PLAN_RATE = "\ub0a9\uae30\uc900\uc218\uc728(\ucd5c\ucd08\ucd9c\uace0\uacc4\ud68d\uc77c)"
 COL_ISSUE_KEY = "__issue_key__"
+COL_CUBE_COUNT = "__count__"
+COL_CUBE_DELAYED = "__delayed__"
+COL_CUBE_LEAD_SUM = "__lead_sum__"
+COL_CUBE_LEAD_COUNT = "__lead_count__"
+MONTH_KEY_MISSING = -1
+INTERNAL_COLUMNS = [COL_MONTH_KEY]
+FILTER_DIMENSIONS = [
+    ("months", COL_MONTH),
+    ("types", COL_TYPE),
+    ("statuses", COL_STATUS),
+    ("countries", COL_COUNTRY),
+    ("owners", COL_OWNER),
+    ("customers", COL_CUSTOMER),
+]
+CUBE_DIMENSIONS = [
+    COL_MONTH_KEY,
+    COL_YEAR,
+    COL_MONTH,
+    COL_TYPE,
+    COL_STATUS,
+    COL_COUNTRY,
+    COL_OWNER,
+    COL_CUSTOMER,
+]
+DEMAND_DIMENSIONS = [COL_CUSTOMER, COL_PRODUCT, COL_TYPE, COL_STATUS, COL_COUNTRY, COL_OWNER]
+SUMMARY_SUMS = [COL_ORDER_QTY, COL_ORDER_AMT, COL_ORDER_AMT_KRW, COL_ORDER_AMT_USD]
+ISSUE_BASE_COLUMNS = [COL_MONTH, COL_TYPE, COL_WORKNO, COL_CUSTOMER, COL_PRODUCT, COL_NOTE]
 
 ORDER_STATUS_NUMERIC = [
     COL_ORDER_QTY,
@@ -217,6 +301,39 @@ LEADTIME_NUMERIC = [
     "\ucd5c\ub300\ub9ac\ub4dc\ud0c0\uc784(\uc77c)",
 ]
 
+ORDER_STATUS_COLUMNS = [
+    COL_MONTH,
+    COL_TYPE,
+    COL_COUNTRY,
+    COL_WORKNO,
+    COL_PRODUCT,
+    COL_CUSTOMER,
+    COL_OWNER,
+    COL_CURRENCY,
+    COL_PROD_EXPECT,
+    COL_STATUS,
+    COL_LEADTIME_REVIEW,
+    COL_DUE_SALES,
+    COL_DUE_PLAN,
+    COL_NOTE,
+] + ORDER_STATUS_NUMERIC + ORDER_STATUS_DATE
+MONTHLY_COLUMNS = [COL_TYPE, COL_MONTH] + MONTHLY_NUMERIC
+LEADTIME_COLUMNS = [COL_MONTH, COL_TYPE] + LEADTIME_NUMERIC
+CATEGORY_COLUMNS = [
+    COL_MONTH,
+    COL_TYPE,
+    COL_STATUS,
+    COL_COUNTRY,
+    COL_OWNER,
+    COL_CUSTOMER,
+    COL_PRODUCT,
+]
+NUMERIC_COLUMNS = set(ORDER_STATUS_NUMERIC + MONTHLY_NUMERIC + LEADTIME_NUMERIC)
+DATE_COLUMNS = set(ORDER_STATUS_DATE)
+EPOCH = datetime(1970, 1, 1)
+DATETIME_MIN = datetime(1677, 9, 22)
+DATETIME_MAX = datetime(2262, 4, 11)
+
 
 def to_numeric(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     for col in columns:
@@ -232,6 +349,53 @@ def to_datetime(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     return df
 
 
+def encode_categories(df: pd.DataFrame) -> pd.DataFrame:
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def decode_categories(df: pd.DataFrame) -> pd.DataFrame:
+    categorical = df.select_dtypes("category").columns
+    if len(categorical) == 0:
+        return df
+    return df.astype({col: object for col in categorical})
+
+
+def isin_codes(series: pd.Series, values: list) -> np.ndarray:
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.isin(values).to_numpy()
+    categories = series.cat.categories
+    wanted = categories.get_indexer(pd.Index(values, dtype=object))
+    allowed = np.zeros(len(categories) + 1, dtype=bool)
+    allowed[wanted[wanted >= 0]] = True
+    return allowed[series.cat.codes.to_numpy()]
+
+
+def column_codes(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, values = pd.factorize(series)
+    return codes, pd.Index(values)
+
+
+def facet_label(counts: Dict[object, int | None]) -> Callable[[object], str]:
+    def label(value: object) -> str:
+        count = counts.get(value)
+        return str(value) if count is None else f"{value} ({count:,})"
+
+    return label
+
+
+def present_values(series: pd.Series) -> list:
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return sorted(series.dropna().unique().tolist())
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    return sorted(series.cat.categories[counts > 0].tolist())
+
+
 def coerce_mixed_date(value: object) -> object:
     if pd.isna(value):
         return ""
@@ -259,7 +423,7 @@ def prepare_display(
     mixed_date_cols: list[str] | None = None,
     percent_cols: list[str] | None = None,
 ) -> pd.DataFrame:
-    display = df.copy()
+    display = df.copy(deep=False)
     percent_cols = percent_cols or []
     for col in numeric_cols:
         if col in display.columns:
@@ -451,103 +615,124 @@ def build_styler(
     return styled
 
 
+def month_key(value: date) -> int:
+    return value.year * 12 + value.month - 1
+
+
+def month_from_key(key: int) -> date:
+    return date(key // 12, key % 12 + 1, 1)
+
+
+def month_label(key: int) -> str:
+    return f"{key // 12:04d}-{key % 12 + 1:02d}"
+
+
+def parse_month_labels(series: pd.Series) -> pd.DataFrame:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        labels, codes = series.cat.categories, series.cat.codes.to_numpy()
+    else:
+        codes, labels = pd.factorize(series)
+    parts = (
+        pd.Series(labels.astype(str))
+        .str.extract(r"(?P<yy>\d{2})\.(?P<mm>\d{2})?")
+        .apply(pd.to_numeric, errors="coerce")
+    )
+    parts.loc[len(parts)] = np.nan
+    return parts.iloc[codes].reset_index(drop=True).set_axis(series.index)
+
+
 def add_year_column(df: pd.DataFrame) -> pd.DataFrame:
     if COL_MONTH not in df.columns:
         return df
-    years = (
-        df[COL_MONTH]
-        .astype(str)
-        .str.extract(r"(?P<yy>\d{2})\.", expand=True)["yy"]
-        .astype("float")
-        .apply(lambda v: int(2000 + v) if pd.notna(v) else None)
-    )
-    df[COL_YEAR] = years
+    years = parse_month_labels(df[COL_MONTH])["yy"] + 2000
+    df[COL_YEAR] = years.astype("int64") if years.notna().all() else years
     return df
 
 
-def add_month_date_column(df: pd.DataFrame) -> pd.DataFrame:
-    if COL_MONTH_DATE in df.columns or COL_MONTH not in df.columns:
+def add_month_key_column(df: pd.DataFrame) -> pd.DataFrame:
+    if COL_MONTH_KEY in df.columns or COL_MONTH not in df.columns:
         return df
-    extracted = df[COL_MONTH].astype(str).str.extract(r"(?P<yy>\d{2})\.(?P<mm>\d{2})")
-    years = pd.to_numeric(extracted["yy"], errors="coerce")
-    months = pd.to_numeric(extracted["mm"], errors="coerce")
-    month_date = pd.to_datetime(
-        {"year": years + 2000, "month": months, "day": 1}, errors="coerce"
-    ).dt.date
-    df = df.copy()
-    df[COL_MONTH_DATE] = month_date
+    parts = parse_month_labels(df[COL_MONTH])
+    valid = parts["yy"].notna() & parts["mm"].between(1, 12)
+    keys = (parts["yy"] + 2000) * 12 + parts["mm"] - 1
+    df[COL_MONTH_KEY] = keys.where(valid, MONTH_KEY_MISSING).astype("int32")
     return df
 
 
-def compute_compliance_rate(
-    df: pd.DataFrame, group_cols: list[str]
-) -> pd.Series:
-    if COL_DUE_PLAN not in df.columns:
-        return pd.Series(dtype="float")
-    total = df.groupby(group_cols, dropna=False)[COL_WORKNO].count()
-    delayed = (
-        df[df[COL_DUE_PLAN] == "\uc9c0\uc5f0"]
-        .groupby(group_cols, dropna=False)[COL_WORKNO]
-        .count()
+def build_summary_cube(df: pd.DataFrame) -> pd.DataFrame:
+    keys = [col for col in CUBE_DIMENSIONS if col in df.columns]
+    counted = df[COL_WORKNO].notna()
+    measures = df[SUMMARY_SUMS].copy()
+    measures[COL_CUBE_COUNT] = counted.astype("int64")
+    measures[COL_CUBE_LEAD_SUM] = df[COL_LEADTIME]
+    measures[COL_CUBE_LEAD_COUNT] = df[COL_LEADTIME].notna().astype("int64")
+    if COL_DUE_PLAN in df.columns:
+        delayed = counted & (df[COL_DUE_PLAN] == "\uc9c0\uc5f0")
+        measures[COL_CUBE_DELAYED] = delayed.astype("int64")
+    cube = measures.groupby([df[col] for col in keys], dropna=False, observed=True).sum()
+    return cube.reset_index()
+
+
+def summary_rollup(cube: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    measures = [col for col in cube.columns if col not in CUBE_DIMENSIONS]
+    detail = cube.groupby(keys, dropna=False, observed=True)[measures].sum().reset_index()
+    total = detail.groupby(keys[:-1], dropna=False, observed=True)[measures].sum().reset_index()
+    total[keys[-1]] = "\ud569\uacc4"
+    levels = pd.concat([detail, total], ignore_index=True)
+    levels["__type_order"] = np.where(levels[keys[-1]] == "\ud569\uacc4", 2, 1)
+    levels = levels.sort_values(keys[:-1] + ["__type_order", keys[-1]])
+
+    count = levels[COL_CUBE_COUNT]
+    summary = levels[keys].copy()
+    summary["\uc791\uc9c0\uac74\uc218"] = count
+    summary["\uc624\ub354\uc218\ub7c9\ud569\uacc4"] = levels[COL_ORDER_QTY]
+    summary["\uc218\uc8fc\uae08\uc561\ud569\uacc4"] = levels[COL_ORDER_AMT]
+    summary["\uc218\uc8fc\uae08\uc561\uc6d0\ud569\uacc4"] = levels[COL_ORDER_AMT_KRW]
+    summary["\uc218\uc8fc\uae08\uc561\ub2ec\ub7ec\ud569\uacc4"] = levels[COL_ORDER_AMT_USD]
+    summary["\ud3c9\uade0\ub9ac\ub4dc\ud0c0\uc784\uc77c"] = levels[COL_CUBE_LEAD_SUM].div(
+        levels[COL_CUBE_LEAD_COUNT].where(levels[COL_CUBE_LEAD_COUNT] > 0)
     )
-    delayed = delayed.reindex(total.index, fill_value=0)
-    rate = (total - delayed).div(total).mul(100)
-    return rate
-
-
-def max_consecutive_months(months: list[date]) -> int:
-    if not months:
-        return 0
-    uniq = sorted({m for m in months if isinstance(m, date)})
-    if not uniq:
-        return 0
-    best = 1
-    current = 1
-    prev_key = uniq[0].year * 12 + uniq[0].month
-    for current_date in uniq[1:]:
-        cur_key = current_date.year * 12 + current_date.month
-        if cur_key - prev_key == 1:
-            current += 1
-        else:
-            current = 1
-        best = max(best, current)
-        prev_key = cur_key
+    if COL_CUBE_DELAYED in levels.columns:
+        summary[COL_DUE_PLAN_RATE] = (count - levels[COL_CUBE_DELAYED]).div(count).mul(100)
+    else:
+        summary[COL_DUE_PLAN_RATE] = np.nan
+    return summary
+
+
+def max_consecutive_months(groups: np.ndarray, keys: np.ndarray, size: int) -> np.ndarray:
+    valid = keys != MONTH_KEY_MISSING
+    groups, keys = groups[valid], keys[valid]
+    order = np.lexsort((keys, groups))
+    groups, keys = groups[order], keys[order]
+    fresh = np.ones(len(keys), dtype=bool)
+    fresh[1:] = (groups[1:] != groups[:-1]) | (keys[1:] != keys[:-1])
+    groups, keys = groups[fresh], keys[fresh]
+    starts = np.ones(len(keys), dtype=bool)
+    starts[1:] = (groups[1:] != groups[:-1]) | (np.diff(keys) != 1)
+    lengths = np.diff(np.append(np.flatnonzero(starts), len(keys)))
+    best = np.zeros(size, dtype=np.int64)
+    np.maximum.at(best, groups[starts], lengths)
     return best
 
 
-def month_sequence(start: date, end: date) -> list[date]:
-    if start is None or end is None or start > end:
-        return []
-    cursor = date(start.year, start.month, 1)
-    last = date(end.year, end.month, 1)
-    months: list[date] = []
-    while cursor <= last:
-        months.append(cursor)
-        if cursor.month == 12:
-            cursor = date(cursor.year + 1, 1, 1)
-        else:
-            cursor = date(cursor.year, cursor.month + 1, 1)
-    return months
-
-
 def compute_product_priority(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty or COL_PRODUCT not in df.columns or COL_ORDER_QTY not in df.columns:
         return pd.DataFrame(
             columns=[COL_PRIORITY, COL_PRODUCT, COL_AVG_DEMAND, COL_PO_COUNT, COL_PO_STREAK, COL_SHARE]
         )
-    df = add_month_date_column(df.copy())
+    df = add_month_key_column(df.copy(deep=False))
     df = df[df[COL_PRODUCT].notna()]
     df = df[df[COL_PRODUCT].astype(str).str.strip().ne("")]
 
     total_qty = df[COL_ORDER_QTY].sum()
-    grouped = df.groupby(COL_PRODUCT, dropna=False)
+    grouped = df.groupby(COL_PRODUCT, dropna=False, observed=True)
     summary = grouped.agg(
         _total_qty=(COL_ORDER_QTY, "sum"),
         _po_count=(COL_WORKNO, "nunique"),
         _avg_demand=(COL_ORDER_QTY, "mean"),
     )
-    summary[COL_PO_STREAK] = grouped[COL_MONTH_DATE].apply(
-        lambda values: max_consecutive_months([v for v in values if pd.notna(v)])
+    summary[COL_PO_STREAK] = max_consecutive_months(
+        grouped.ngroup().to_numpy(), df[COL_MONTH_KEY].to_numpy(), len(summary)
     )
     if total_qty:
         summary[COL_SHARE] = (summary["_total_qty"] / total_qty) * 100
@@ -577,89 +762,50 @@ def compute_product_priority(df: pd.DataFrame) -> pd.DataFrame:
     return summary.reset_index(drop=True)
 
 
-def max_consecutive_flags(flags: list[bool]) -> int:
-    best = 0
-    current = 0
-    for flag in flags:
-        if flag:
-            current += 1
-            best = max(best, current)
-        else:
-            current = 0
-    return best
+def max_consecutive_flags(flags: np.ndarray) -> np.ndarray:
+    counts = np.cumsum(flags, axis=1)
+    # Each run counts up from the cumulative total at the last False before it.
+    resets = np.maximum.accumulate(np.where(flags, 0, counts), axis=1)
+    return (counts - resets).max(axis=1)
 
 
-def compute_product_monthly_summary(
-    df: pd.DataFrame, month_range: tuple[date, date] | None
-) -> pd.DataFrame:
-    month_list: list[date] = []
-    if month_range:
-        start, end = month_range
-        if start.year != end.year:
-            start = date(start.year, 1, 1)
-            end = date(end.year, 12, 1)
-        month_list = month_sequence(start, end)
+def demand_months(month_range: tuple[date, date] | None) -> list[int]:
+    if not month_range:
+        return []
+    start, end = month_range
+    if start.year != end.year:
+        start = date(start.year, 1, 1)
+        end = date(end.year, 12, 1)
+    return list(range(month_key(start), month_key(end) + 1))
 
-    if df.empty or COL_PRODUCT not in df.columns or COL_ORDER_QTY not in df.columns:
-        if not month_list:
-            return pd.DataFrame()
-        month_labels = [m.strftime("%Y-%m") for m in month_list]
-        columns = (
-            [COL_PRIORITY, COL_CUSTOMER, COL_ROW_LABEL]
-            + month_labels
-            + [
-                COL_TOTAL_ORDERS,
-                COL_CONSECUTIVE_ORDERS,
-                COL_WEIGHTED_SCORE,
-                COL_AVG_DEMAND,
-            ]
-        )
-        return pd.DataFrame(columns=columns)
 
-    df = add_month_date_column(df.copy())
+def demand_rows(df: pd.DataFrame) -> pd.DataFrame:
+    df = add_month_key_column(df.copy(deep=False))
     df = df[df[COL_PRODUCT].notna()]
     df = df[df[COL_PRODUCT].astype(str).str.strip().ne("")]
     if COL_CUSTOMER in df.columns:
         df = df[df[COL_CUSTOMER].notna()]
-    df = df[df[COL_MONTH_DATE].notna()]
-    if df.empty:
-        return pd.DataFrame()
+    return df[df[COL_MONTH_KEY] != MONTH_KEY_MISSING]
 
-    if not month_list:
-        min_month = df[COL_MONTH_DATE].min()
-        max_month = df[COL_MONTH_DATE].max()
-        if pd.isna(min_month) or pd.isna(max_month):
-            return pd.DataFrame()
-        month_list = month_sequence(min_month, max_month)
-    if not month_list:
-        return pd.DataFrame()
 
-    month_labels = [m.strftime("%Y-%m") for m in month_list]
-    df[COL_MONTH_DATE] = df[COL_MONTH_DATE].apply(
-        lambda d: date(d.year, d.month, 1)
-    )
-    pivot = (
-        df.pivot_table(
-            index=[COL_CUSTOMER, COL_PRODUCT],
-            columns=COL_MONTH_DATE,
-            values=COL_ORDER_QTY,
-            aggfunc="sum",
-            fill_value=0,
-        )
-        .reindex(columns=month_list, fill_value=0)
-        .copy()
-    )
+def rank_demand(
+    pairs: pd.MultiIndex,
+    pivot: np.ndarray,
+    total_qty: np.ndarray,
+    recent_sum: np.ndarray,
+    month_labels: list[str],
+    dtype: object,
+) -> pd.DataFrame:
     total_orders = (pivot > 0).sum(axis=1)
-    consecutive = pivot.apply(
-        lambda row: max_consecutive_flags([val > 0 for val in row.tolist()]), axis=1
-    )
-    recent_cols = month_list[-6:]
-    recent_sum = pivot[recent_cols].sum(axis=1) if recent_cols else 0
+    consecutive = max_consecutive_flags(pivot > 0)
     weighted = ((total_orders / 1000) + (consecutive * 5) + (recent_sum * 2 / 1000)).round(0)
-    total_qty = pivot.sum(axis=1)
-    avg_demand = total_qty.div(consecutive.replace(0, pd.NA)).fillna(0)
+    avg_demand = np.divide(
+        total_qty, consecutive, out=np.zeros(len(pairs)), where=consecutive > 0
+    )
 
-    result = pivot.copy()
+    result = pd.DataFrame(pivot, columns=month_labels).astype(dtype)
+    result.insert(0, COL_CUSTOMER, pairs.get_level_values(0))
+    result.insert(1, COL_ROW_LABEL, pairs.get_level_values(1))
     result[COL_TOTAL_ORDERS] = total_orders
     result[COL_CONSECUTIVE_ORDERS] = consecutive
     result[COL_WEIGHTED_SCORE] = weighted
@@ -669,10 +815,7 @@ def compute_product_monthly_summary(
         by=[COL_WEIGHTED_SCORE, COL_TOTAL_ORDERS, COL_AVG_DEMAND],
         ascending=[False, False, False],
     )
-    result = result.reset_index().rename(columns={COL_PRODUCT: COL_ROW_LABEL})
     result[COL_PRIORITY] = range(1, len(result) + 1)
-    rename_map = {m: label for m, label in zip(month_list, month_labels)}
-    result = result.rename(columns=rename_map)
     result = result[
         [COL_PRIORITY, COL_CUSTOMER, COL_ROW_LABEL]
         + month_labels
@@ -686,6 +829,59 @@ def compute_product_monthly_summary(
     return result.reset_index(drop=True)
 
 
+def compute_product_monthly_summary(
+    df: pd.DataFrame, month_range: tuple[date, date] | None
+) -> pd.DataFrame:
+    month_list = demand_months(month_range)
+
+    if df.empty or COL_PRODUCT not in df.columns or COL_ORDER_QTY not in df.columns:
+        if not month_list:
+            return pd.DataFrame()
+        month_labels = [month_label(m) for m in month_list]
+        columns = (
+            [COL_PRIORITY, COL_CUSTOMER, COL_ROW_LABEL]
+            + month_labels
+            + [
+                COL_TOTAL_ORDERS,
+                COL_CONSECUTIVE_ORDERS,
+                COL_WEIGHTED_SCORE,
+                COL_AVG_DEMAND,
+            ]
+        )
+        return pd.DataFrame(columns=columns)
+
+    df = demand_rows(df)
+    if df.empty:
+        return pd.DataFrame()
+
+    if not month_list:
+        month_list = list(
+            range(int(df[COL_MONTH_KEY].min()), int(df[COL_MONTH_KEY].max()) + 1)
+        )
+    if not month_list:
+        return pd.DataFrame()
+
+    month_labels = [month_label(m) for m in month_list]
+    grouped = df.groupby([COL_CUSTOMER, COL_PRODUCT], observed=True)
+    pairs = grouped.size().index
+    rows = grouped.ngroup().to_numpy()
+    months = df[COL_MONTH_KEY].to_numpy().astype(np.int64) - month_list[0]
+    inside = (months >= 0) & (months < len(month_list))
+    qty = df[COL_ORDER_QTY].fillna(0).to_numpy(dtype=float)
+    cells = rows[inside] * len(month_list) + months[inside]
+    pivot = np.bincount(
+        cells, weights=qty[inside], minlength=len(pairs) * len(month_list)
+    ).reshape(len(pairs), len(month_list))
+    return rank_demand(
+        pairs,
+        pivot,
+        pivot.sum(axis=1),
+        pivot[:, -6:].sum(axis=1),
+        month_labels,
+        df[COL_ORDER_QTY].dtype,
+    )
+
+
 def move_note_before_year(df: pd.DataFrame) -> pd.DataFrame:
     if COL_NOTE not in df.columns or COL_YEAR not in df.columns:
         return df
@@ -702,7 +898,7 @@ def replace_capa_delay(df: pd.DataFrame) -> pd.DataFrame:
 
 def build_issue_key(df: pd.DataFrame) -> pd.Series:
     return (
-        df[[COL_WORKNO, COL_CUSTOMER, COL_PRODUCT, COL_NOTE]]
+        decode_categories(df[[COL_WORKNO, COL_CUSTOMER, COL_PRODUCT, COL_NOTE]])
         .fillna("")
         .astype(str)
         .agg("|".join, axis=1)
@@ -732,12 +928,36 @@ def load_issue_tracker(path: Path) -> pd.DataFrame:
 
 
 def save_issue_tracker(df: pd.DataFrame, path: Path) -> None:
-    export_df = df[
-        [COL_ISSUE_KEY, COL_RESOLVED, COL_CLOSED_DATE, COL_ISSUE_DATE]
-    ].copy()
+    export_df = df[[COL_ISSUE_KEY, COL_RESOLVED, COL_CLOSED_DATE, COL_ISSUE_DATE]]
     export_df.to_excel(path, index=False)
 
 
+def file_stamp(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def build_issue_view(df: pd.DataFrame, tracker_path: Path) -> pd.DataFrame | None:
+    if COL_NOTE not in df.columns:
+        return None
+    issues = df[df[COL_NOTE].notna()]
+    issues = issues[issues[COL_NOTE].astype(str).str.strip().ne("")]
+    if issues.empty:
+        return None
+
+    issues = decode_categories(issues[ISSUE_BASE_COLUMNS].drop_duplicates())
+    issues[COL_ISSUE_KEY] = build_issue_key(issues)
+
+    tracker = load_issue_tracker(tracker_path)
+    merged = issues.merge(tracker, on=COL_ISSUE_KEY, how="left")
+    merged[COL_RESOLVED] = merged[COL_RESOLVED].fillna(False).astype(bool)
+    merged[COL_CLOSED_DATE] = pd.to_datetime(merged[COL_CLOSED_DATE], errors="coerce").dt.date
+    merged[COL_ISSUE_DATE] = pd.to_datetime(merged[COL_ISSUE_DATE], errors="coerce").dt.date
+    return merged
+
+
 def add_months(base: date, offset: int) -> date:
     total = base.month - 1 + offset
     year = base.year + total // 12
@@ -779,14 +999,15 @@ def clamp_range(start: date, end: date, min_date: date, max_date: date) -> Tuple
 
 def render_period_controls(df: pd.DataFrame, key_prefix: str) -> Tuple[date, date] | None:
     month_range = None
-    if COL_MONTH_DATE not in df.columns:
+    if COL_MONTH_KEY not in df.columns:
         return month_range
-    month_values = df[COL_MONTH_DATE].dropna().tolist()
-    if not month_values:
+    keys = df[COL_MONTH_KEY].to_numpy()
+    keys = keys[keys != MONTH_KEY_MISSING]
+    if keys.size == 0:
         return month_range
 
-    month_min = min(month_values)
-    month_max = max(month_values)
+    month_min = month_from_key(int(keys.min()))
+    month_max = month_from_key(int(keys.max()))
     min_date = month_min
     max_date = last_day_of_month(month_max)
     current_month = date.today().replace(day=1)
@@ -856,112 +1077,1122 @@ def calc_table_height(
     return min(max_height, header_height + row_height * row_count)
 
 
-def add_search_column(df: pd.DataFrame) -> pd.DataFrame:
-    if SEARCH_COL in df.columns:
-        return df
-    text = df.fillna("").astype(str).agg(" ".join, axis=1).str.lower()
-    df = df.copy()
-    df[SEARCH_COL] = text
+def value_texts(series: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, uniques = series.cat.codes.to_numpy(), pd.Series(series.cat.categories)
+    else:
+        codes, uniques = pd.factorize(series)
+        uniques = pd.Series(uniques)
+    if uniques.empty:
+        return codes, pd.Series([], dtype=object)
+    if pd.api.types.is_datetime64_any_dtype(uniques) and series.isna().any():
+        texts = uniques.map(str)
+    else:
+        texts = uniques.astype(str)
+    return codes, texts.str.lower()
+
+
+def month_texts(keys: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    codes, uniques = pd.factorize(keys.where(keys != MONTH_KEY_MISSING))
+    return codes, pd.Series([f"{month_label(int(key))}-01" for key in uniques], dtype=object)
+
+
+def is_text_column(series: pd.Series) -> bool:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = pd.Series(series.cat.categories)
+    return series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) == "string"
+
+
+def normalize_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+    for col in df.columns:
+        series = df[col]
+        if series.dtype != object:
+            continue
+        kind = pd.api.types.infer_dtype(series, skipna=True)
+        if kind in ("string", "date", "empty"):
+            continue
+        df[col] = series.map(lambda v: v if pd.isna(v) else str(v))
     return df
 
 
-@st.cache_data(show_spinner=False)
-def load_from_path(path: str, mtime: float) -> Dict[str, pd.DataFrame]:
-    xl = pd.ExcelFile(path)
-    data = {
-        "order_status": pd.read_excel(xl, sheet_name="order_status"),
-        "order_status_by_item": pd.read_excel(xl, sheet_name="order_status_by_item"),
-        "monthly_summary": pd.read_excel(xl, sheet_name="monthly_summary"),
-        "summary_by_month": pd.read_excel(xl, sheet_name="summary_by_month"),
-    }
-    data["order_status"] = to_datetime(
-        to_numeric(data["order_status"], ORDER_STATUS_NUMERIC), ORDER_STATUS_DATE
-    )
-    data["order_status"] = replace_capa_delay(data["order_status"])
-    data["order_status"] = add_year_column(data["order_status"])
-    data["order_status"] = add_month_date_column(data["order_status"])
-    data["order_status"] = add_search_column(data["order_status"])
-    data["order_status_by_item"] = to_datetime(
-        to_numeric(data["order_status_by_item"], ORDER_STATUS_NUMERIC), ORDER_STATUS_DATE
+def snapshot_path(name: str, mtime: float, digest: str) -> Path:
+    return SNAPSHOT_DIR / name / f"v{SNAPSHOT_VERSION}-{int(mtime * 1_000_000)}-{digest}"
+
+
+def snapshot_stamp(directory: Path) -> int:
+    _, stamp, _ = directory.name.split("-", 2)
+    return int(stamp)
+
+
+def read_snapshot(directory: Path | None, sheet: str) -> pd.DataFrame | None:
+    if directory is None or not SNAPSHOT_ENABLED:
+        return None
+    file = directory / f"{sheet}.parquet"
+    if not file.exists():
+        return None
+    try:
+        df = pd.read_parquet(file)
+    except Exception:
+        LOGGER.warning("Ignoring unreadable snapshot %s", file, exc_info=True)
+        return None
+    # Parquet returns missing object values as None; a fresh parse has NaN there.
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def write_snapshot(directory: Path | None, sheet: str, df: pd.DataFrame) -> None:
+    if directory is None or not SNAPSHOT_ENABLED:
+        return
+    staging = directory / f".{sheet}.tmp-{os.getpid()}-{threading.get_ident()}"
+    try:
+        if not directory.exists():
+            siblings = list(directory.parent.glob("v*")) if directory.parent.exists() else []
+            if any(snapshot_stamp(other) > snapshot_stamp(directory) for other in siblings):
+                return
+            for stale in siblings:
+                shutil.rmtree(stale, ignore_errors=True)
+            directory.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(staging)
+        os.replace(staging, directory / f"{sheet}.parquet")
+    except Exception:
+        LOGGER.warning("Could not write snapshot %s", directory, exc_info=True)
+        staging.unlink(missing_ok=True)
+
+
+def lock_file(fd: int) -> bool:
+    if fcntl is None:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def unlock_file(fd: int) -> None:
+    if fcntl is None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class SnapshotLock:
+    """Cross-process lock on a workbook's snapshots, released by the OS if its holder dies."""
+
+    def __init__(self, directory: Path | None) -> None:
+        self.file = None
+        self.fd: int | None = None
+        if directory is not None and SNAPSHOT_ENABLED:
+            self.file = directory.parent / ".lock"
+
+    def __enter__(self) -> "SnapshotLock":
+        if self.file is None:
+            return self
+        try:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            self.fd = os.open(self.file, os.O_CREAT | os.O_RDWR)
+            deadline = time.monotonic() + SNAPSHOT_LOCK_TIMEOUT
+            waited = False
+            while not lock_file(self.fd):
+                if time.monotonic() > deadline:
+                    LOGGER.warning("Timed out waiting for snapshot lock %s", self.file)
+                    self._release()
+                    return self
+                if not waited:
+                    LOGGER.info("Waiting for the snapshot build holding %s", self.file)
+                    waited = True
+                time.sleep(SNAPSHOT_LOCK_POLL)
+        except OSError:
+            LOGGER.warning("Could not lock snapshot %s", self.file, exc_info=True)
+            self._release()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.fd is not None:
+            unlock_file(self.fd)
+        self._release()
+
+    def _release(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def sort_by_month(df: pd.DataFrame) -> pd.DataFrame:
+    if COL_MONTH_KEY not in df.columns:
+        return df
+    return df.sort_values(COL_MONTH_KEY, kind="stable", ignore_index=True)
+
+
+def prepare_order_sheet(df: pd.DataFrame) -> pd.DataFrame:
+    df = to_datetime(to_numeric(df, ORDER_STATUS_NUMERIC), ORDER_STATUS_DATE)
+    df = replace_capa_delay(df)
+    df = encode_categories(normalize_object_columns(df))
+    df = add_year_column(df)
+    df = add_month_key_column(df)
+    return sort_by_month(df)
+
+
+def prepare_monthly_sheet(df: pd.DataFrame) -> pd.DataFrame:
+    return encode_categories(to_numeric(df, MONTHLY_NUMERIC))
+
+
+def prepare_leadtime_sheet(df: pd.DataFrame) -> pd.DataFrame:
+    return encode_categories(to_numeric(df, LEADTIME_NUMERIC))
+
+
+SHEET_PREPARERS: Dict[str, Callable[[pd.DataFrame], pd.DataFrame]] = {
+    SHEET_ORDER_STATUS: prepare_order_sheet,
+    SHEET_BY_ITEM: prepare_order_sheet,
+    SHEET_MONTHLY: prepare_monthly_sheet,
+    SHEET_LEADTIME: prepare_leadtime_sheet,
+}
+SHEET_COLUMNS: Dict[str, list[str]] = {
+    SHEET_ORDER_STATUS: ORDER_STATUS_COLUMNS,
+    SHEET_BY_ITEM: ORDER_STATUS_COLUMNS,
+    SHEET_MONTHLY: MONTHLY_COLUMNS,
+    SHEET_LEADTIME: LEADTIME_COLUMNS,
+}
+
+
+class NumericBuilder:
+    def __init__(self) -> None:
+        self.values = array("d")
+        self.integral = True
+
+    def append(self, value: object) -> None:
+        if isinstance(value, str):
+            try:
+                value = float(value.strip())
+            except ValueError:
+                value = None
+        if isinstance(value, (int, float)):
+            number = float(value)
+            self.integral = self.integral and number.is_integer()
+        else:
+            number = float("nan")
+            self.integral = False
+        self.values.append(number)
+
+    def finish(self) -> np.ndarray:
+        result = np.frombuffer(self.values, dtype="float64")
+        return result.astype("int64") if self.integral else result.copy()
+
+
+class DateBuilder:
+    def __init__(self) -> None:
+        self.values = array("q")
+        self.pending: list[tuple[int, object]] = []
+
+    def append(self, value: object) -> None:
+        if isinstance(value, datetime) and DATETIME_MIN <= value <= DATETIME_MAX:
+            self.values.append((value - EPOCH) // timedelta(microseconds=1))
+            return
+        if value is not None and value != "":
+            self.pending.append((len(self.values), value))
+        self.values.append(np.iinfo("int64").min)
+
+    def finish(self) -> pd.DatetimeIndex:
+        result = pd.to_datetime(np.frombuffer(self.values, dtype="int64"), unit="us")
+        if not self.pending:
+            return result
+        positions, raw = zip(*self.pending)
+        parsed = pd.to_datetime(pd.Series(raw, dtype=object), errors="coerce")
+        values = result.to_numpy(copy=True)
+        values[list(positions)] = parsed.to_numpy(dtype="datetime64[us]")
+        return pd.DatetimeIndex(values)
+
+
+class TextBuilder:
+    def __init__(self) -> None:
+        self.values: list[object] = []
+
+    def append(self, value: object) -> None:
+        self.values.append(np.nan if value is None else value)
+
+    def finish(self) -> np.ndarray:
+        result = np.empty(len(self.values), dtype=object)
+        result[:] = self.values
+        return result
+
+
+def read_sheet(workbook: Workbook, sheet: str) -> pd.DataFrame:
+    wanted = set(SHEET_COLUMNS[sheet])
+    rows = workbook[sheet].iter_rows(values_only=True)
+    header = next(rows, None) or ()
+    positions = [
+        (idx, str(name))
+        for idx, name in enumerate(header)
+        if name is not None and str(name) in wanted
+    ]
+    columns = {}
+    for _, name in positions:
+        if name in NUMERIC_COLUMNS:
+            columns[name] = NumericBuilder()
+        elif name in DATE_COLUMNS:
+            columns[name] = DateBuilder()
+        else:
+            columns[name] = TextBuilder()
+    appenders = [(idx, columns[name].append) for idx, name in positions]
+    for row in rows:
+        if all(value is None for value in row):
+            continue
+        width = len(row)
+        for idx, append in appenders:
+            append(row[idx] if idx < width else None)
+    return pd.DataFrame({name: column.finish() for name, column in columns.items()})
+
+
+def ingest_sheet(workbook: Workbook, sheet: str) -> pd.DataFrame:
+    return SHEET_PREPARERS[sheet](read_sheet(workbook, sheet))
+
+
+class MonthIndex:
+    """Row offsets of each month in a frame sorted by COL_MONTH_KEY."""
+
+    def __init__(self, keys: np.ndarray) -> None:
+        self.size = len(keys)
+        self.keys, self.starts = np.unique(keys, return_index=True)
+        self.starts = np.append(self.starts, self.size)
+
+    def positions(self, month_range: Tuple[date, date] | None) -> slice:
+        if month_range is None:
+            return slice(0, len(self.keys))
+        start, end = month_range
+        lo = np.searchsorted(self.keys, month_key(start), side="left")
+        hi = np.searchsorted(self.keys, month_key(end), side="right")
+        return slice(int(lo), int(hi))
+
+    def rows(self, months: slice) -> slice:
+        return slice(int(self.starts[months.start]), int(self.starts[months.stop]))
+
+
+class FacetCounts:
+    """Row counts per month for every distinct value of one column."""
+
+    def __init__(self, series: pd.Series, months: MonthIndex) -> None:
+        codes, self.values = column_codes(series)
+        month_of_row = np.repeat(np.arange(len(months.keys)), np.diff(months.starts))
+        valid = codes >= 0
+        cells = month_of_row[valid] * len(self.values) + codes[valid]
+        shape = (len(months.keys), len(self.values))
+        self.counts = np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape)
+
+    def options(self, months: slice) -> Dict[object, int]:
+        totals = self.counts[months].sum(axis=0)
+        present = sorted(np.flatnonzero(totals), key=lambda i: self.values[i])
+        return {self.values[i]: int(totals[i]) for i in present}
+
+
+class NgramIndex:
+    """Trigram posting lists over a list of lowercase documents."""
+
+    def __init__(self, docs: np.ndarray) -> None:
+        self.docs = docs
+        self.size = len(docs)
+        text = "".join(doc.replace("\0", " ") + "\0\0" for doc in docs)
+        points = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+        lengths = np.fromiter((len(doc) + 2 for doc in docs), dtype=np.int64, count=self.size)
+        owner = np.repeat(np.arange(self.size, dtype=np.int32), lengths)[: max(len(points) - 2, 0)]
+        real = points[:-2] != 0
+        grams = (points[:-2] << 42) | (points[1:-1] << 21) | points[2:]
+        codes, grams = pd.factorize(grams[real])
+        owner = owner[real]
+        rank = np.argsort(grams)
+        self.grams = grams[rank]
+        inverse = np.empty_like(rank)
+        inverse[rank] = np.arange(len(rank))
+        codes = inverse[codes]
+        # Stable sort keeps each posting list in row order; it is a radix sort for uint16.
+        key_dtype = np.uint16 if len(rank) <= 1 << 16 else np.int64
+        order = np.argsort(codes.astype(key_dtype), kind="stable")
+        codes, owner = codes[order], owner[order]
+        fresh = np.ones(len(codes), dtype=bool)
+        fresh[1:] = (codes[1:] != codes[:-1]) | (owner[1:] != owner[:-1])
+        self.postings = owner[fresh]
+        counts = np.bincount(codes[fresh], minlength=len(rank))
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def _posting(self, lo: int, hi: int) -> np.ndarray:
+        first, last = np.searchsorted(self.grams, [lo, hi])
+        return self.postings[self.offsets[first] : self.offsets[last]]
+
+    def _literal(self, token: str, scope: np.ndarray) -> np.ndarray:
+        points = [ord(char) for char in token]
+        if len(points) < 3:
+            prefix = 0
+            for point in points:
+                prefix = (prefix << 21) | point
+            shift = 21 * (3 - len(points))
+            found = np.zeros(self.size, dtype=bool)
+            found[self._posting(prefix << shift, (prefix + 1) << shift)] = True
+            return found
+        found = scope.copy()
+        grams = {
+            (points[i] << 42) | (points[i + 1] << 21) | points[i + 2]
+            for i in range(len(points) - 2)
+        }
+        for gram in grams:
+            present = np.zeros(self.size, dtype=bool)
+            present[self._posting(gram, gram + 1)] = True
+            found &= present
+        if len(points) > 3:
+            rows = np.flatnonzero(found)
+            found[rows] = [token in doc for doc in self.docs[rows]]
+        return found
+
+    def _token(self, token: str, scope: np.ndarray) -> np.ndarray:
+        special = set(SEARCH_METACHARS.findall(token))
+        if not special:
+            return self._literal(token, scope)
+        found = scope.copy()
+        if special == {"."}:
+            for fragment in token.split("."):
+                if fragment:
+                    found &= self._literal(fragment, found)
+        rows = np.flatnonzero(found)
+        text = pd.Series(self.docs[rows], dtype=object)
+        found[rows] = text.str.contains(token, na=False).to_numpy()
+        return found
+
+    def lookup(self, token: str) -> np.ndarray:
+        return self._token(token, np.ones(self.size, dtype=bool))
+
+
+class ValueIndex:
+    """Search over each column's distinct values, expanded to rows through their codes."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.size = len(frame)
+        encoded = [
+            (value_texts(frame[col]), is_text_column(frame[col]))
+            for col in frame.columns
+            if col not in INTERNAL_COLUMNS
+        ]
+        if COL_MONTH_KEY in frame.columns:
+            # Searchable as the month's first day, like the old __month_date__ column.
+            encoded.append((month_texts(frame[COL_MONTH_KEY]), False))
+        vocab_ids, vocab = pd.factorize(pd.concat([texts for (_, texts), _ in encoded]))
+        bounds = np.cumsum([0] + [len(texts) for (_, texts), _ in encoded])
+        self.columns: list[Tuple[np.ndarray, np.ndarray, bool]] = [
+            (codes.astype(np.int32, copy=False), vocab_ids[lo:hi], text)
+            for ((codes, _), text), lo, hi in zip(encoded, bounds[:-1], bounds[1:])
+        ]
+        self.vocab = NgramIndex(np.asarray(vocab, dtype=object))
+        # Folded keys only cover words in text columns; numbers and dates match literally.
+        textual = np.zeros(len(vocab), dtype=bool)
+        for _, ids, text in self.columns:
+            textual[ids] |= text
+        textual &= np.fromiter((any(c.isalpha() for c in t) for t in vocab), bool, len(vocab))
+        self.key_ids = np.flatnonzero(textual)
+        self.keys = NgramIndex(
+            np.array([search_keys(vocab[i]) for i in self.key_ids], dtype=object)
+        )
+
+    def _terms(self, token: str) -> Tuple[np.ndarray, np.ndarray]:
+        literal = self.vocab.lookup(token)
+        keyed = literal.copy()
+        folded = fold_text(token)
+        if folded:
+            keyed[self.key_ids] |= self.keys.lookup(folded)
+        stripped = strip_suffix(token)
+        if stripped and stripped != folded:
+            keyed[self.key_ids] |= self.keys.lookup(stripped)
+        return literal, keyed
+
+    def _rows(self, terms: Tuple[np.ndarray, np.ndarray], rows: np.ndarray | None) -> np.ndarray:
+        literal, keyed = terms
+        found = np.zeros(self.size if rows is None else len(rows), dtype=bool)
+        for codes, ids, text in self.columns:
+            hit = (keyed if text else literal)[ids]
+            if not hit.any():
+                continue
+            hit = np.append(hit, False)
+            found |= hit[codes if rows is None else codes[rows]]
+        return found
+
+    def match(self, groups: list[list[str]], within: np.ndarray | None = None) -> np.ndarray:
+        rows = None
+        if within is not None and within.sum() <= SEARCH_REFINE_ROWS:
+            rows = np.flatnonzero(within)
+        hits = np.zeros(self.size if rows is None else len(rows), dtype=bool)
+        for tokens in groups:
+            group = ~hits
+            for token in sorted(tokens, key=len):
+                group &= self._rows(self._terms(token), rows)
+                if not group.any():
+                    break
+            hits |= group
+        if rows is not None:
+            found = np.zeros(self.size, dtype=bool)
+            found[rows[hits]] = True
+            return found
+        return hits if within is None else hits & within
+
+
+def fold_text(text: str) -> str:
+    return SEARCH_FOLD.sub("", text)
+
+
+def strip_suffix(text: str) -> str:
+    return fold_text(CORPORATE_SUFFIX.sub(" ", text))
+
+
+def search_keys(text: str) -> str:
+    folded = fold_text(text)
+    keys = [folded]
+    stripped = strip_suffix(text)
+    if stripped and stripped != folded:
+        keys.append(stripped)
+    initials = folded.translate(CHOSUNG_TABLE)
+    if initials != folded:
+        keys.append(initials)
+    return " ".join(keys)
+
+
+def refinable(token: str) -> bool:
+    folded = fold_text(token)
+    return bool(folded) and not SEARCH_METACHARS.search(token) and strip_suffix(token) == folded
+
+
+def refines(query: Tuple[Tuple[str, ...], ...], cached: Tuple[Tuple[str, ...], ...]) -> bool:
+    if not all(refinable(token) for tokens in query + cached for token in tokens):
+        return False
+    return all(
+        any(all(any(old in new for new in group) for old in other) for other in cached)
+        for group in query
     )
-    data["order_status_by_item"] = replace_capa_delay(data["order_status_by_item"])
-    data["order_status_by_item"] = add_year_column(data["order_status_by_item"])
-    data["order_status_by_item"] = add_month_date_column(data["order_status_by_item"])
-    data["order_status_by_item"] = add_search_column(data["order_status_by_item"])
-    data["monthly_summary"] = to_numeric(data["monthly_summary"], MONTHLY_NUMERIC)
-    data["summary_by_month"] = to_numeric(data["summary_by_month"], LEADTIME_NUMERIC)
+
+
+class ValueBitmaps:
+    """Packed row bitmaps for every distinct value of one column."""
+
+    def __init__(self, series: pd.Series) -> None:
+        codes, self.values = column_codes(series)
+        rows = np.arange(len(codes))
+        # Code -1 lands in the extra last bitmap, which collects missing values.
+        self.bits = np.zeros((len(self.values) + 1, (len(codes) + 7) // 8), dtype=np.uint8)
+        np.bitwise_or.at(self.bits, (codes, rows >> 3), (128 >> (rows & 7)).astype(np.uint8))
+
+    def select(self, wanted: list, span: slice) -> np.ndarray | None:
+        lo, hi = span.start, span.stop
+        chosen = np.zeros(len(self.values) + 1, dtype=bool)
+        found = self.values.get_indexer(pd.Index(wanted, dtype=object))
+        chosen[found[found >= 0]] = True
+        window = self.bits[:, lo // 8 : (hi + 7) // 8]
+        rejected = np.bitwise_or.reduce(window[~chosen], axis=0)
+        if not rejected.any():
+            return None
+        if chosen.sum() < len(chosen) // 2:
+            keep = np.bitwise_or.reduce(window[chosen], axis=0)
+        else:
+            keep = ~rejected
+        start = lo - (lo // 8) * 8
+        return np.unpackbits(keep)[start : start + hi - lo].astype(bool)
+
+
+class DemandMatrix:
+    """Monthly order quantities with prefix sums per customer, product and filter values."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        df = demand_rows(frame)
+        keys = [col for col in DEMAND_DIMENSIONS if col in df.columns]
+        grouped = df.groupby(keys, dropna=False, observed=True)
+        self.rows = grouped.size().index.to_frame(index=False)
+        pair_groups = self.rows.groupby([COL_CUSTOMER, COL_PRODUCT], observed=True)
+        self.pairs = pair_groups.size().index
+        self.pair_of_row = pair_groups.ngroup().to_numpy()
+        self.dtype = df[COL_ORDER_QTY].dtype
+
+        months = df[COL_MONTH_KEY].to_numpy().astype(np.int64)
+        self.first = int(months.min()) if len(months) else 0
+        width = int(months.max()) - self.first + 1 if len(months) else 0
+        shape = (len(self.rows), width)
+        cells = grouped.ngroup().to_numpy() * width + months - self.first
+        qty = df[COL_ORDER_QTY].fillna(0).to_numpy(dtype=float)
+        self.qty = np.bincount(cells, weights=qty, minlength=shape[0] * shape[1]).reshape(shape)
+        seen = np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape)
+        self.qty_sums = np.zeros((shape[0], width + 1))
+        np.cumsum(self.qty, axis=1, out=self.qty_sums[:, 1:])
+        self.seen_sums = np.zeros((shape[0], width + 1), dtype=np.int64)
+        np.cumsum(seen, axis=1, out=self.seen_sums[:, 1:])
+
+    def _column(self, key: int) -> int:
+        return int(np.clip(key - self.first, 0, self.qty.shape[1]))
+
+    def summary(
+        self, month_range: Tuple[date, date], active: list[Tuple[str, list]]
+    ) -> pd.DataFrame | None:
+        lo = self._column(month_key(month_range[0]))
+        hi = self._column(month_key(month_range[1]) + 1)
+        keep = self.seen_sums[:, hi] > self.seen_sums[:, lo]
+        for col, values in active:
+            keep &= isin_codes(self.rows[col], values)
+        rows = np.flatnonzero(keep)
+        if len(rows) == 0:
+            return None
+        pair = self.pair_of_row[rows]
+        starts = np.flatnonzero(np.r_[True, pair[1:] != pair[:-1]])
+
+        month_list = demand_months(month_range)
+        columns = np.array(month_list) - self.first
+        inside = (columns >= lo) & (columns < hi)
+        pivot = np.zeros((len(starts), len(month_list)))
+        if inside.any():
+            pivot[:, inside] = np.add.reduceat(self.qty[rows][:, columns[inside]], starts, axis=0)
+        recent_lo = max(lo, self._column(month_list[-6:][0]))
+        sums = self.qty_sums[rows]
+        total_qty = np.add.reduceat(sums[:, hi] - sums[:, lo], starts)
+        recent_sum = np.add.reduceat(sums[:, hi] - sums[:, min(recent_lo, hi)], starts)
+        return rank_demand(
+            self.pairs[pair[starts]],
+            pivot,
+            total_qty,
+            recent_sum,
+            [month_label(m) for m in month_list],
+            self.dtype,
+        )
+
+
+def deep_nbytes(value: object) -> int:
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return int(pd.Index(value.ravel()).memory_usage(deep=True))
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (list, tuple)):
+        return sum(deep_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(deep_nbytes(item) for item in value.values())
+    if hasattr(value, "__dict__"):
+        return deep_nbytes(vars(value))
+    return 0
+
+
+class SheetIndex:
+    """Lookup structures derived from one prepared sheet, built on first use."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame
+        self._built: Dict[str, object] = {}
+        self._sizes: Dict[str, int] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _derive(self, name: str, build: Callable[[], object]) -> object:
+        if name in self._built:
+            return self._built[name]
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._built:
+                self._built[name] = build()
+        return self._built[name]
+
+    @property
+    def nbytes(self) -> int:
+        total = 0
+        for name, value in list(self._built.items()):
+            if isinstance(value, BoundedLRU):
+                total += value.nbytes
+                continue
+            if name not in self._sizes:
+                built = value.frame if isinstance(value, SheetIndex) else value
+                self._sizes[name] = deep_nbytes(built)
+            total += self._sizes[name]
+            if isinstance(value, SheetIndex):
+                total += value.nbytes
+        return total
+
+    @property
+    def months(self) -> MonthIndex:
+        return self._derive("months", lambda: MonthIndex(self.frame[COL_MONTH_KEY].to_numpy()))
+
+    def facets(self, col: str) -> FacetCounts:
+        return self._derive(f"facets:{col}", lambda: FacetCounts(self.frame[col], self.months))
+
+    def bitmaps(self, col: str) -> ValueBitmaps:
+        return self._derive(f"bitmaps:{col}", lambda: ValueBitmaps(self.frame[col]))
+
+    @property
+    def demand(self) -> DemandMatrix:
+        return self._derive("demand", lambda: DemandMatrix(self.frame))
+
+    @property
+    def cube(self) -> "SheetIndex":
+        return self._derive("cube", lambda: SheetIndex(build_summary_cube(self.frame)))
+
+    @property
+    def search(self) -> "ValueIndex":
+        return self._derive("search", lambda: ValueIndex(self.frame))
+
+    @property
+    def queries(self) -> "BoundedLRU":
+        return self._derive(
+            "queries",
+            lambda: BoundedLRU(
+                "search",
+                SEARCH_CACHE_MAX_ENTRIES,
+                SEARCH_CACHE_MAX_BYTES,
+                SEARCH_CACHE_TTL,
+                lambda entry: entry[0].nbytes,
+            ),
+        )
+
+    @property
+    def selections(self) -> "BoundedLRU":
+        return self._derive(
+            "selections",
+            lambda: BoundedLRU(
+                "selection",
+                SELECTION_CACHE_MAX_ENTRIES,
+                SELECTION_CACHE_MAX_BYTES,
+                SELECTION_CACHE_TTL,
+                lambda rows: getattr(rows, "nbytes", 0),
+            ),
+        )
+
+    def select(
+        self, months: slice, active: list[Tuple[str, list]], groups: list[list[str]]
+    ) -> np.ndarray | slice:
+        key = (
+            (months.start, months.stop),
+            tuple((col, frozenset(values)) for col, values in active),
+            tuple(tuple(tokens) for tokens in groups),
+        )
+        rows = self.selections.get(key)
+        if rows is not None:
+            return rows
+        span = self.months.rows(months)
+        mask = None
+        for col, values in active:
+            selected = self.bitmaps(col).select(values, span)
+            if selected is not None:
+                mask = selected if mask is None else mask & selected
+        if groups:
+            hits = self.match(groups)[span]
+            mask = hits if mask is None else mask & hits
+        rows = slice(None) if mask is None else np.flatnonzero(mask).astype(np.int32)
+        self.selections.put(key, rows)
+        return rows
+
+    def match(self, groups: list[list[str]]) -> np.ndarray:
+        key = tuple(tuple(tokens) for tokens in groups)
+        cached = self.queries.get(key)
+        if cached is not None:
+            return np.unpackbits(cached[0], count=len(self.frame)).astype(bool)
+        base = None
+        for other, (bits, count) in self.queries.items():
+            if (base is None or count < base[1]) and refines(key, other):
+                base = (bits, count)
+        within = None
+        if base is not None:
+            within = np.unpackbits(base[0], count=len(self.frame)).astype(bool)
+        hits = self.search.match(groups, within)
+        self.queries.put(key, (np.packbits(hits), int(hits.sum())))
+        return hits
+
+
+class WorkbookData(Mapping):
+    """Workbook sheets that are parsed and prepared the first time they are read."""
+
+    def __init__(self, content: bytes, snapshot: Path | None = None, version: str = "") -> None:
+        self.content = content
+        self.snapshot = snapshot
+        self.version = version
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._sizes: Dict[str, int] = {}
+        self._indexes: Dict[str, SheetIndex] = {}
+        self._locks = {sheet: threading.Lock() for sheet in SHEET_PREPARERS}
+
+    def __getitem__(self, sheet: str) -> pd.DataFrame:
+        frame = self._frames.get(sheet)
+        if frame is not None:
+            return frame
+        with self._locks[sheet]:
+            if sheet not in self._frames:
+                self._frames[sheet] = self._load([sheet])[sheet]
+        return self._frames[sheet]
+
+    def __iter__(self):
+        return iter(SHEET_PREPARERS)
+
+    def __len__(self) -> int:
+        return len(SHEET_PREPARERS)
+
+    def index(self, sheet: str) -> SheetIndex:
+        frame = self[sheet]
+        with self._locks[sheet]:
+            if sheet not in self._indexes:
+                self._indexes[sheet] = SheetIndex(frame)
+        return self._indexes[sheet]
+
+    @property
+    def nbytes(self) -> int:
+        for sheet, frame in list(self._frames.items()):
+            if sheet not in self._sizes:
+                self._sizes[sheet] = deep_nbytes(frame)
+        indexes = list(self._indexes.values())
+        return len(self.content) + sum(self._sizes.values()) + sum(i.nbytes for i in indexes)
+
+    def prefetch(self, sheets: list[str]) -> "WorkbookData":
+        for sheet in sheets:
+            self._locks[sheet].acquire()
+        try:
+            missing = [sheet for sheet in sheets if sheet not in self._frames]
+            if missing:
+                self._frames.update(self._load(missing))
+        finally:
+            for sheet in sheets:
+                self._locks[sheet].release()
+        return self
+
+    def _load(self, sheets: list[str]) -> Dict[str, pd.DataFrame]:
+        frames = self._read_snapshots(sheets)
+        if len(frames) == len(sheets):
+            return frames
+        with SnapshotLock(self.snapshot):
+            frames.update(self._read_snapshots([s for s in sheets if s not in frames]))
+            pending = [sheet for sheet in sheets if sheet not in frames]
+            if pending:
+                frames.update(self._parse(pending))
+        return frames
+
+    def _read_snapshots(self, sheets: list[str]) -> Dict[str, pd.DataFrame]:
+        frames = {}
+        for sheet in sheets:
+            cached = read_snapshot(self.snapshot, sheet)
+            if cached is not None:
+                frames[sheet] = cached
+        return frames
+
+    def _parse(self, pending: list[str]) -> Dict[str, pd.DataFrame]:
+        frames = {}
+        workbook = load_workbook(io.BytesIO(self.content), read_only=True, data_only=True)
+        try:
+            for sheet in pending:
+                frames[sheet] = ingest_sheet(workbook, sheet)
+                write_snapshot(self.snapshot, sheet, frames[sheet])
+        finally:
+            workbook.close()
+        return frames
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[object, Tuple[threading.Event, list]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: object, fn: Callable[[], object]) -> object:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = (threading.Event(), [None, None])
+        done, outcome = call
+        if not leader:
+            LOGGER.info("Waiting for in-flight load of %s", key)
+            done.wait()
+        else:
+            try:
+                outcome[0] = fn()
+            except BaseException as exc:
+                outcome[1] = exc
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                done.set()
+        if outcome[1] is not None:
+            raise outcome[1]
+        return outcome[0]
+
+
+@st.cache_resource(show_spinner=False)
+def load_flights() -> SingleFlight:
+    return SingleFlight()
+
+
+def content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def build_from_path(path: str, mtime: float) -> WorkbookData:
+    content = Path(path).read_bytes()
+    digest = content_digest(content)
+    snapshot = snapshot_path(Path(path).stem, mtime, digest)
+    return WorkbookData(content, snapshot, digest).prefetch(EAGER_SHEETS)
+
+
+def warm_dataset(data: WorkbookData) -> WorkbookData:
+    for sheet in EAGER_SHEETS:
+        data.index(sheet).months
+        data.index(sheet).search
+        data.index(sheet).cube
+    data.index(SHEET_BY_ITEM).demand
     return data
 
 
-@st.cache_data(show_spinner=False)
-def load_from_bytes(content: bytes, key: str) -> Dict[str, pd.DataFrame]:
-    xl = pd.ExcelFile(io.BytesIO(content))
-    data = {
-        "order_status": pd.read_excel(xl, sheet_name="order_status"),
-        "order_status_by_item": pd.read_excel(xl, sheet_name="order_status_by_item"),
-        "monthly_summary": pd.read_excel(xl, sheet_name="monthly_summary"),
-        "summary_by_month": pd.read_excel(xl, sheet_name="summary_by_month"),
-    }
-    data["order_status"] = to_datetime(
-        to_numeric(data["order_status"], ORDER_STATUS_NUMERIC), ORDER_STATUS_DATE
-    )
-    data["order_status"] = replace_capa_delay(data["order_status"])
-    data["order_status"] = add_year_column(data["order_status"])
-    data["order_status"] = add_month_date_column(data["order_status"])
-    data["order_status"] = add_search_column(data["order_status"])
-    data["order_status_by_item"] = to_datetime(
-        to_numeric(data["order_status_by_item"], ORDER_STATUS_NUMERIC), ORDER_STATUS_DATE
+class DatasetWatcher:
+    """Polls a workbook and swaps in a freshly prepared dataset when it changes."""
+
+    def __init__(self, path: Path, interval: float = WATCH_INTERVAL) -> None:
+        self.path = path
+        self.interval = interval
+        self.live: Tuple[float, WorkbookData] | None = None
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"watch-{path.name}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def refreshing(self) -> bool:
+        return self.pending > 0
+
+    def current(self) -> Tuple[float, WorkbookData]:
+        live = self.live
+        if live is None:
+            live = self._build(self.path.stat().st_mtime)
+        return live
+
+    def refresh(self) -> None:
+        self._check(force=True)
+
+    def _check(self, force: bool = False) -> None:
+        mtime = self.path.stat().st_mtime
+        live = self.live
+        if live is not None and live[0] == mtime and not force:
+            return
+        if live is not None and content_digest(self.path.read_bytes()) == live[1].version:
+            # Same contents under a new mtime (e.g. a re-copied file): keep the parsed data.
+            with self._lock:
+                if self.live is live:
+                    self.live = (mtime, live[1])
+            return
+        self._build(mtime)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            try:
+                self._check()
+            except Exception:
+                LOGGER.warning("Could not refresh %s", self.path, exc_info=True)
+
+    def _build(self, mtime: float) -> Tuple[float, WorkbookData]:
+        path = str(self.path)
+        with self._lock:
+            self.pending += 1
+        try:
+            data = load_flights().do(
+                (path, mtime), lambda: warm_dataset(build_from_path(path, mtime))
+            )
+        finally:
+            with self._lock:
+                self.pending -= 1
+        with self._lock:
+            if self.live is None or self.live[1] is not data:
+                LOGGER.info("Serving %s version %s", self.path.name, data.version)
+                self.live = (mtime, data)
+            return self.live
+
+
+@st.cache_resource(show_spinner=False)
+def dataset_watcher(path: str) -> DatasetWatcher:
+    return DatasetWatcher(Path(path))
+
+
+class BoundedLRU:
+    """Thread-safe LRU bounded by entry count, total weight and idle time."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float,
+        weigh: Callable[[object], int],
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.weigh = weigh
+        self._entries: "OrderedDict[object, Tuple[object, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: object) -> object | None:
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, size, _ = entry
+            # Values such as WorkbookData grow as sheets and indexes are built lazily.
+            weight = self.weigh(value)
+            self._bytes += weight - size
+            self._entries[key] = (value, weight, time.monotonic())
+            self._entries.move_to_end(key)
+            self._shrink()
+            return value
+
+    def put(self, key: object, value: object) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            for other, (held, _, used) in list(self._entries.items()):
+                self._entries[other] = (held, self.weigh(held), used)
+            self._entries[key] = (value, self.weigh(value), time.monotonic())
+            self._bytes = sum(weight for _, weight, _ in self._entries.values())
+            self._expire(time.monotonic())
+            self._shrink()
+
+    def _shrink(self) -> None:
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._evict(next(iter(self._entries)), "capacity")
+
+    def items(self) -> list[Tuple[object, object]]:
+        with self._lock:
+            return [(key, value) for key, (value, _, _) in self._entries.items()]
+
+    def pop(self, key: object) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def _expire(self, now: float) -> None:
+        stale = [key for key, (_, _, used) in self._entries.items() if now - used > self.ttl]
+        for key in stale:
+            self._evict(key, "ttl")
+
+    def _evict(self, key: object, reason: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        LOGGER.info(
+            "Evicted %s entry %s (%s, %d bytes); %d entries / %d bytes remain",
+            self.name,
+            key,
+            reason,
+            size,
+            len(self._entries),
+            self._bytes,
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def upload_cache() -> BoundedLRU:
+    return BoundedLRU(
+        "upload",
+        UPLOAD_CACHE_MAX_ENTRIES,
+        UPLOAD_CACHE_MAX_BYTES,
+        UPLOAD_CACHE_TTL,
+        lambda data: data.nbytes,
     )
-    data["order_status_by_item"] = replace_capa_delay(data["order_status_by_item"])
-    data["order_status_by_item"] = add_year_column(data["order_status_by_item"])
-    data["order_status_by_item"] = add_month_date_column(data["order_status_by_item"])
-    data["order_status_by_item"] = add_search_column(data["order_status_by_item"])
-    data["monthly_summary"] = to_numeric(data["monthly_summary"], MONTHLY_NUMERIC)
-    data["summary_by_month"] = to_numeric(data["summary_by_month"], LEADTIME_NUMERIC)
+
+
+def upload_digest(upload) -> str:
+    digests = st.session_state.setdefault("upload_digests", {})
+    digest = digests.get(upload.file_id)
+    if digest is None:
+        digest = hashlib.sha256(upload.getbuffer()).hexdigest()
+        digests.clear()
+        digests[upload.file_id] = digest
+    return digest
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_issue_view(version: str, tracker_stamp: int, _data: WorkbookData) -> SheetIndex | None:
+    view = build_issue_view(_data[SHEET_BY_ITEM], ISSUE_TRACKER_PATH)
+    return None if view is None else SheetIndex(view)
+
+
+def load_from_upload(upload) -> WorkbookData:
+    cache = upload_cache()
+    digest = upload_digest(upload)
+    data = cache.get(digest)
+    if data is None:
+        data = load_flights().do(digest, lambda: build_from_upload(upload, digest))
     return data
 
 
+def build_from_upload(upload, digest: str) -> WorkbookData:
+    data = upload_cache().get(digest)
+    if data is None:
+        data = WorkbookData(upload.getvalue(), version=digest[:16])
+        data.prefetch(EAGER_SHEETS)
+        upload_cache().put(digest, data)
+    return data
+
+
+def month_range_mask(df: pd.DataFrame, month_range: Tuple[date, date]) -> np.ndarray:
+    keys = df[COL_MONTH_KEY].to_numpy()
+    start, end = month_range
+    return (keys >= month_key(start)) & (keys <= month_key(end))
+
+
+def active_filters(
+    filters: dict, columns: pd.Index, apply_month_filter: bool = True
+) -> list[Tuple[str, list]]:
+    return [
+        (col, filters[key])
+        for key, col in FILTER_DIMENSIONS
+        if filters.get(key) and col in columns and (apply_month_filter or key != "months")
+    ]
+
+
 def apply_order_filters(
     df: pd.DataFrame,
     month_range: Tuple[date, date] | None,
     filters: dict | None = None,
     show_sidebar: bool = True,
     apply_month_filter: bool = True,
+    index: SheetIndex | None = None,
+    query: str = "",
 ) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
     if filters is None:
         filters = {}
 
+    df_period = df
+    span = None
+    if index is not None and index.frame is df:
+        months = index.months.positions(month_range)
+        span = index.months.rows(months)
+        df_period = df.iloc[span]
+    elif month_range and COL_MONTH_KEY in df.columns:
+        df_period = df[month_range_mask(df, month_range)]
+
     if show_sidebar:
         with st.sidebar:
             st.subheader("\ud544\ud130")
-            df_period = df
-            if month_range and COL_MONTH_DATE in df.columns:
-                start, end = month_range
-                df_period = df[
-                    (df[COL_MONTH_DATE] >= start) & (df[COL_MONTH_DATE] <= end)
-                ]
-
-            months = sorted(df_period[COL_MONTH].dropna().unique().tolist())
-            types = sorted(df_period[COL_TYPE].dropna().unique().tolist())
-            statuses = sorted(
-                df_period.get(COL_STATUS, pd.Series(dtype=str)).dropna().unique().tolist()
-            )
-            countries = sorted(
-                df_period.get(COL_COUNTRY, pd.Series(dtype=str)).dropna().unique().tolist()
-            )
-            owners = sorted(
-                df_period.get(COL_OWNER, pd.Series(dtype=str)).dropna().unique().tolist()
-            )
-            customers = sorted(
-                df_period.get(COL_CUSTOMER, pd.Series(dtype=str)).dropna().unique().tolist()
-            )
 
-            filters["months"] = st.multiselect(COL_MONTH, months, default=months)
-            filters["types"] = st.multiselect(COL_TYPE, types, default=types)
-            filters["statuses"] = st.multiselect(COL_STATUS, statuses, default=statuses)
-            filters["countries"] = st.multiselect(COL_COUNTRY, countries, default=countries)
-            filters["owners"] = st.multiselect(COL_OWNER, owners, default=owners)
-            filters["customers"] = st.multiselect(COL_CUSTOMER, customers, default=customers)
+            for key, col in FILTER_DIMENSIONS:
+                if span is not None and col in df.columns:
+                    counts = index.facets(col).options(months)
+                else:
+                    counts = dict.fromkeys(present_values(df_period.get(col, pd.Series(dtype=str))))
+                options = list(counts)
+                filters[key] = st.multiselect(
+                    col, options, default=options, format_func=facet_label(counts)
+                )
 
     filters.setdefault("months", [])
     filters.setdefault("types", [])
@@ -970,50 +2201,68 @@ def apply_order_filters(
     filters.setdefault("owners", [])
     filters.setdefault("customers", [])
 
-    base_df = df
-    if apply_month_filter and filters["months"]:
-        base_df = base_df[base_df[COL_MONTH].isin(filters["months"])]
-    if filters["types"]:
-        base_df = base_df[base_df[COL_TYPE].isin(filters["types"])]
-    if filters["statuses"] and COL_STATUS in base_df.columns:
-        base_df = base_df[base_df[COL_STATUS].isin(filters["statuses"])]
-    if filters["countries"] and COL_COUNTRY in base_df.columns:
-        base_df = base_df[base_df[COL_COUNTRY].isin(filters["countries"])]
-    if filters["owners"] and COL_OWNER in base_df.columns:
-        base_df = base_df[base_df[COL_OWNER].isin(filters["owners"])]
-    if filters["customers"] and COL_CUSTOMER in base_df.columns:
-        base_df = base_df[base_df[COL_CUSTOMER].isin(filters["customers"])]
-
-    if month_range and COL_MONTH_DATE in base_df.columns:
-        start, end = month_range
-        base_df = base_df[(base_df[COL_MONTH_DATE] >= start) & (base_df[COL_MONTH_DATE] <= end)]
+    active = active_filters(filters, df.columns, apply_month_filter)
+    if span is None:
+        base_df = df_period
+        for col, values in active:
+            base_df = base_df[isin_codes(base_df[col], values)]
+        base_df = apply_search(base_df, query)
+        return base_df, base_df, filters
 
+    base_df = df_period.iloc[index.select(months, active, search_groups(query))]
     return base_df, base_df, filters
 
 
-def apply_search(df: pd.DataFrame, query: str) -> pd.DataFrame:
+def summarize_orders(
+    df: pd.DataFrame,
+    month_range: Tuple[date, date] | None,
+    filters: dict,
+    apply_month_filter: bool = True,
+    index: SheetIndex | None = None,
+    query: str = "",
+) -> pd.DataFrame:
+    if index is None or search_groups(query):
+        return build_summary_cube(df)
+    cube, _, _ = apply_order_filters(
+        index.cube.frame,
+        month_range,
+        filters=filters,
+        show_sidebar=False,
+        apply_month_filter=apply_month_filter,
+        index=index.cube,
+    )
+    return cube
+
+
+def summarize_demand(
+    df: pd.DataFrame,
+    month_range: Tuple[date, date] | None,
+    filters: dict,
+    apply_month_filter: bool = True,
+    index: SheetIndex | None = None,
+    query: str = "",
+) -> pd.DataFrame:
+    columns = index.frame.columns if index is not None else df.columns
+    if (
+        index is None
+        or month_range is None
+        or search_groups(query)
+        or any(col not in columns for col in [COL_CUSTOMER, COL_PRODUCT, COL_ORDER_QTY])
+    ):
+        return compute_product_monthly_summary(df, month_range)
+    active = active_filters(filters, columns, apply_month_filter)
+    if any(col not in DEMAND_DIMENSIONS for col, _ in active):
+        return compute_product_monthly_summary(df, month_range)
+    summary = index.demand.summary(month_range, active)
+    return compute_product_monthly_summary(df, month_range) if summary is None else summary
+
+
+def search_groups(query: str) -> list[list[str]]:
     query = query.strip()
     if not query:
-        return df
+        return []
     if "," in query:
-        suffix_patterns = [
-            r",\s*co\.?\s*,\s*ltd\.?",
-            r",\s*co\.?\s*ltd\.?",
-            r",\s*ltd\.?",
-            r",\s*inc\.?",
-            r",\s*corp\.?",
-            r",\s*llc\.?",
-            r",\s*plc\.?",
-            r",\s*gmbh\.?",
-            r",\s*sa\.?",
-            r",\s*srl\.?",
-            r",\s*bv\.?",
-            r",\s*kg\.?",
-        ]
-        temp = query.lower()
-        for pattern in suffix_patterns:
-            temp = re.sub(pattern, "", temp)
-        if "," in temp:
+        if "," in COMMA_SUFFIX.sub("", query.lower()):
             parts = [part.strip() for part in query.split(",") if part.strip()]
         else:
             parts = [query]
@@ -1024,18 +2273,18 @@ def apply_search(df: pd.DataFrame, query: str) -> pd.DataFrame:
         tokens = [t.lower() for t in part.split() if t]
         if tokens:
             groups.append(tokens)
+    return groups
+
+
+def apply_search(df: pd.DataFrame, query: str, index: SheetIndex | None = None) -> pd.DataFrame:
+    groups = search_groups(query)
     if not groups:
         return df
 
-    if SEARCH_COL in df.columns:
-        text_series = df[SEARCH_COL].astype(str)
-        mask = pd.Series(False, index=df.index)
-        for tokens in groups:
-            group_mask = pd.Series(True, index=df.index)
-            for token in tokens:
-                group_mask &= text_series.str.contains(token, na=False)
-            mask |= group_mask
-        return df[mask]
+    if index is not None:
+        positions = index.frame.index.get_indexer(df.index)
+        if len(positions) == 0 or positions.min() >= 0:
+            return df[index.match(groups)[positions]]
 
     text_df = df.astype(str).apply(lambda s: s.str.lower())
     mask = pd.Series(False, index=df.index)
@@ -1050,58 +2299,15 @@ def apply_search(df: pd.DataFrame, query: str) -> pd.DataFrame:
     return df[mask]
 
 
-def render_year_summary(df: pd.DataFrame, key_prefix: str) -> None:
-    if COL_YEAR not in df.columns:
+def render_year_summary(cube: pd.DataFrame, key_prefix: str) -> None:
+    if COL_YEAR not in cube.columns:
         return
     show_monthly = st.toggle(
         "\uc6d4\ubcc4 \uc694\uc57d \ubcf4\uae30",
         value=False,
         key=f"{key_prefix}_monthly_toggle",
     )
-    summary_type = (
-        df.groupby([COL_YEAR, COL_TYPE], dropna=False)
-        .agg(
-            **{
-                "\uc791\uc9c0\uac74\uc218": (COL_WORKNO, "count"),
-                "\uc624\ub354\uc218\ub7c9\ud569\uacc4": (COL_ORDER_QTY, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ud569\uacc4": (COL_ORDER_AMT, "sum"),
-                "\uc218\uc8fc\uae08\uc561\uc6d0\ud569\uacc4": (COL_ORDER_AMT_KRW, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ub2ec\ub7ec\ud569\uacc4": (COL_ORDER_AMT_USD, "sum"),
-                "\ud3c9\uade0\ub9ac\ub4dc\ud0c0\uc784\uc77c": (COL_LEADTIME, "mean"),
-            }
-        )
-        .reset_index()
-    )
-    rate_type = compute_compliance_rate(df, [COL_YEAR, COL_TYPE]).reset_index(
-        name=COL_DUE_PLAN_RATE
-    )
-    summary_type = summary_type.merge(rate_type, on=[COL_YEAR, COL_TYPE], how="left")
-    summary_total = (
-        df.groupby(COL_YEAR, dropna=False)
-        .agg(
-            **{
-                "\uc791\uc9c0\uac74\uc218": (COL_WORKNO, "count"),
-                "\uc624\ub354\uc218\ub7c9\ud569\uacc4": (COL_ORDER_QTY, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ud569\uacc4": (COL_ORDER_AMT, "sum"),
-                "\uc218\uc8fc\uae08\uc561\uc6d0\ud569\uacc4": (COL_ORDER_AMT_KRW, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ub2ec\ub7ec\ud569\uacc4": (COL_ORDER_AMT_USD, "sum"),
-                "\ud3c9\uade0\ub9ac\ub4dc\ud0c0\uc784\uc77c": (COL_LEADTIME, "mean"),
-            }
-        )
-        .reset_index()
-    )
-    rate_total = compute_compliance_rate(df, [COL_YEAR]).reset_index(
-        name=COL_DUE_PLAN_RATE
-    )
-    summary_total = summary_total.merge(rate_total, on=[COL_YEAR], how="left")
-    summary_total[COL_TYPE] = "\ud569\uacc4"
-    summary = pd.concat([summary_type, summary_total], ignore_index=True)
-    summary["__type_order"] = summary[COL_TYPE].apply(
-        lambda value: 2 if value == "\ud569\uacc4" else 1
-    )
-    summary = summary.sort_values([COL_YEAR, "__type_order", COL_TYPE]).drop(
-        columns="__type_order"
-    )
+    summary = summary_rollup(cube, [COL_YEAR, COL_TYPE])
     display = summary.rename(
         columns={
             COL_YEAR: COL_YEAR,
@@ -1143,54 +2349,7 @@ def render_year_summary(df: pd.DataFrame, key_prefix: str) -> None:
     if not show_monthly:
         return
 
-    monthly_type = (
-        df.groupby([COL_YEAR, COL_MONTH, COL_TYPE], dropna=False)
-        .agg(
-            **{
-                "\uc791\uc9c0\uac74\uc218": (COL_WORKNO, "count"),
-                "\uc624\ub354\uc218\ub7c9\ud569\uacc4": (COL_ORDER_QTY, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ud569\uacc4": (COL_ORDER_AMT, "sum"),
-                "\uc218\uc8fc\uae08\uc561\uc6d0\ud569\uacc4": (COL_ORDER_AMT_KRW, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ub2ec\ub7ec\ud569\uacc4": (COL_ORDER_AMT_USD, "sum"),
-                "\ud3c9\uade0\ub9ac\ub4dc\ud0c0\uc784\uc77c": (COL_LEADTIME, "mean"),
-            }
-        )
-        .reset_index()
-    )
-    monthly_rate_type = compute_compliance_rate(
-        df, [COL_YEAR, COL_MONTH, COL_TYPE]
-    ).reset_index(name=COL_DUE_PLAN_RATE)
-    monthly_type = monthly_type.merge(
-        monthly_rate_type, on=[COL_YEAR, COL_MONTH, COL_TYPE], how="left"
-    )
-    monthly_total = (
-        df.groupby([COL_YEAR, COL_MONTH], dropna=False)
-        .agg(
-            **{
-                "\uc791\uc9c0\uac74\uc218": (COL_WORKNO, "count"),
-                "\uc624\ub354\uc218\ub7c9\ud569\uacc4": (COL_ORDER_QTY, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ud569\uacc4": (COL_ORDER_AMT, "sum"),
-                "\uc218\uc8fc\uae08\uc561\uc6d0\ud569\uacc4": (COL_ORDER_AMT_KRW, "sum"),
-                "\uc218\uc8fc\uae08\uc561\ub2ec\ub7ec\ud569\uacc4": (COL_ORDER_AMT_USD, "sum"),
-                "\ud3c9\uade0\ub9ac\ub4dc\ud0c0\uc784\uc77c": (COL_LEADTIME, "mean"),
-            }
-        )
-        .reset_index()
-    )
-    monthly_rate_total = compute_compliance_rate(
-        df, [COL_YEAR, COL_MONTH]
-    ).reset_index(name=COL_DUE_PLAN_RATE)
-    monthly_total = monthly_total.merge(
-        monthly_rate_total, on=[COL_YEAR, COL_MONTH], how="left"
-    )
-    monthly_total[COL_TYPE] = "\ud569\uacc4"
-    monthly = pd.concat([monthly_type, monthly_total], ignore_index=True)
-    monthly["__type_order"] = monthly[COL_TYPE].apply(
-        lambda value: 2 if value == "\ud569\uacc4" else 1
-    )
-    monthly = monthly.sort_values([COL_YEAR, COL_MONTH, "__type_order", COL_TYPE]).drop(
-        columns="__type_order"
-    )
+    monthly = summary_rollup(cube, [COL_YEAR, COL_MONTH, COL_TYPE])
     monthly = monthly.rename(
         columns={
             COL_YEAR: COL_YEAR,
@@ -1358,22 +2517,26 @@ def main() -> None:
         st.subheader("\ub370\uc774\ud130")
         upload = st.file_uploader("\uc5d1\uc140 \uc5c5\ub85c\ub4dc", type=["xlsx"])
         refresh = st.button("\ub370\uc774\ud130 \uc0c8\ub85c\uace0\uce68")
-        if refresh:
-            st.cache_data.clear()
 
     if upload:
-        data = load_from_bytes(upload.getvalue(), upload.name)
+        if refresh:
+            upload_cache().pop(upload_digest(upload))
+        data = load_from_upload(upload)
         source_label = f"\uc5c5\ub85c\ub4dc \ud30c\uc77c: {upload.name}"
     else:
         if not DEFAULT_FILE.exists():
             st.error(f"\ub370\uc774\ud130 \ud30c\uc77c\uc744 \ucc3e\uc744 \uc218 \uc5c6\uc2b5\ub2c8\ub2e4: {DEFAULT_FILE}")
             st.stop()
-        mtime = DEFAULT_FILE.stat().st_mtime
-        data = load_from_path(str(DEFAULT_FILE), mtime)
+        watcher = dataset_watcher(str(DEFAULT_FILE))
+        if refresh:
+            watcher.refresh()
+        mtime, data = watcher.current()
         source_label = (
             f"\uae30\ubcf8 \ud30c\uc77c: {DEFAULT_FILE.name} "
-            f"(\uc218\uc815: {datetime.fromtimestamp(mtime)})"
+            f"(\uc218\uc815: {datetime.fromtimestamp(mtime)}, \ubc84\uc804: {data.version})"
         )
+        if watcher.refreshing:
+            source_label += " \u00b7 \uc0c8 \ubc84\uc804 \uc900\ube44 \uc911"
 
     st.caption(source_label)
 
@@ -1384,25 +2547,27 @@ def main() -> None:
 
     with tabs[0]:
         st.subheader(TAB_ORDER_STATUS)
-        df = data["order_status"].copy()
+        index = data.index(SHEET_ORDER_STATUS)
+        df = index.frame
         month_range = render_period_controls(df, "main")
-
-        detail_df, summary_df, shared_filters = apply_order_filters(
-            df, month_range, show_sidebar=True
-        )
         query = st.text_input(
             "\ud1b5\ud569 \uac80\uc0c9 (\uc6d0\ud558\ub294 \ud0a4\uc6cc\ub4dc\ub97c \uc785\ub825\ud558\uba74 \ud3ec\ud568\ub41c \ud589\ub9cc \ud45c\uc2dc\ub429\ub2c8\ub2e4)",
             "",
             key="main_search",
         )
-        summary_df = apply_search(summary_df, query)
-        render_year_summary(summary_df, "main")
 
-        detail_df = apply_search(detail_df, query)
+        detail_df, _, shared_filters = apply_order_filters(
+            df, month_range, show_sidebar=True, index=index, query=query
+        )
+        summary_cube = summarize_orders(
+            detail_df, month_range, shared_filters, index=index, query=query
+        )
+        render_year_summary(summary_cube, "main")
+
         detail_df = move_note_before_year(detail_df)
 
         numeric_cols = ORDER_STATUS_NUMERIC + [COL_YEAR]
-        detail_df = detail_df.drop(columns=[SEARCH_COL], errors="ignore")
+        detail_df = detail_df.drop(columns=INTERNAL_COLUMNS, errors="ignore")
         display_df = prepare_display(
             detail_df,
             numeric_cols,
@@ -1435,29 +2600,38 @@ def main() -> None:
 
     with tabs[1]:
         st.subheader(TAB_BY_ITEM)
-        df = data["order_status_by_item"].copy()
+        index = data.index(SHEET_BY_ITEM)
+        df = index.frame
         month_range = render_period_controls(df, "item")
+        query = st.text_input(
+            "\ud1b5\ud569 \uac80\uc0c9 (\uc6d0\ud558\ub294 \ud0a4\uc6cc\ub4dc\ub97c \uc785\ub825\ud558\uba74 \ud3ec\ud568\ub41c \ud589\ub9cc \ud45c\uc2dc\ub429\ub2c8\ub2e4)",
+            "",
+            key="item_search",
+        )
 
-        detail_df, summary_df, _ = apply_order_filters(
+        detail_df, _, _ = apply_order_filters(
             df,
             month_range,
             filters=shared_filters or {},
             show_sidebar=False,
             apply_month_filter=False,
+            index=index,
+            query=query,
         )
-        query = st.text_input(
-            "\ud1b5\ud569 \uac80\uc0c9 (\uc6d0\ud558\ub294 \ud0a4\uc6cc\ub4dc\ub97c \uc785\ub825\ud558\uba74 \ud3ec\ud568\ub41c \ud589\ub9cc \ud45c\uc2dc\ub429\ub2c8\ub2e4)",
-            "",
-            key="item_search",
+        summary_cube = summarize_orders(
+            detail_df,
+            month_range,
+            shared_filters or {},
+            apply_month_filter=False,
+            index=index,
+            query=query,
         )
-        summary_df = apply_search(summary_df, query)
-        render_year_summary(summary_df, "item")
+        render_year_summary(summary_cube, "item")
 
-        detail_df = apply_search(detail_df, query)
         detail_df = move_note_before_year(detail_df)
 
         numeric_cols = ORDER_STATUS_NUMERIC + [COL_YEAR]
-        detail_df = detail_df.drop(columns=[SEARCH_COL], errors="ignore")
+        detail_df = detail_df.drop(columns=INTERNAL_COLUMNS, errors="ignore")
         display_df = prepare_display(
             detail_df,
             numeric_cols,
@@ -1490,8 +2664,14 @@ def main() -> None:
 
     with tabs[2]:
         st.subheader(TAB_PRODUCT_SUMMARY)
-        df = data["order_status_by_item"].copy()
+        index = data.index(SHEET_BY_ITEM)
+        df = index.frame
         month_range = render_period_controls(df, "product")
+        query = st.text_input(
+            "\ud1b5\ud569 \uac80\uc0c9 (\uc791\uc9c0\ubc88\ud638/\ud488\uba85 \ubc94\uc704\ub85c \uac80\uc0c9)",
+            "",
+            key="product_summary_search",
+        )
 
         detail_df, _, _ = apply_order_filters(
             df,
@@ -1499,13 +2679,9 @@ def main() -> None:
             filters=shared_filters or {},
             show_sidebar=False,
             apply_month_filter=False,
+            index=index,
+            query=query,
         )
-        query = st.text_input(
-            "\ud1b5\ud569 \uac80\uc0c9 (\uc791\uc9c0\ubc88\ud638/\ud488\uba85 \ubc94\uc704\ub85c \uac80\uc0c9)",
-            "",
-            key="product_summary_search",
-        )
-        detail_df = apply_search(detail_df, query)
 
         if detail_df.empty:
             st.info("\ud574\ub2f9 \uae30\uac04\uc5d0 \ub370\uc774\ud130\uac00 \uc5c6\uc2b5\ub2c8\ub2e4.")
@@ -1530,8 +2706,14 @@ def main() -> None:
 
     with tabs[3]:
         st.subheader(TAB_PRODUCT_MONTHLY)
-        df = data["order_status_by_item"].copy()
+        index = data.index(SHEET_BY_ITEM)
+        df = index.frame
         month_range = render_period_controls(df, "product_monthly")
+        query = st.text_input(
+            "\ud1b5\ud569 \uac80\uc0c9 (\uc791\uc9c0\ubc88\ud638/\ud488\uba85 \ubc94\uc704\ub85c \uac80\uc0c9)",
+            "",
+            key="product_monthly_search",
+        )
 
         detail_df, _, _ = apply_order_filters(
             df,
@@ -1539,15 +2721,18 @@ def main() -> None:
             filters=shared_filters or {},
             show_sidebar=False,
             apply_month_filter=False,
+            index=index,
+            query=query,
         )
-        query = st.text_input(
-            "\ud1b5\ud569 \uac80\uc0c9 (\uc791\uc9c0\ubc88\ud638/\ud488\uba85 \ubc94\uc704\ub85c \uac80\uc0c9)",
-            "",
-            key="product_monthly_search",
-        )
-        detail_df = apply_search(detail_df, query)
 
-        monthly_df = compute_product_monthly_summary(detail_df, month_range)
+        monthly_df = summarize_demand(
+            detail_df,
+            month_range,
+            shared_filters or {},
+            apply_month_filter=False,
+            index=index,
+            query=query,
+        )
         if monthly_df.empty:
             st.info("\ud574\ub2f9 \uae30\uac04\uc5d0 \ub370\uc774\ud130\uac00 \uc5c6\uc2b5\ub2c8\ub2e4.")
         else:
@@ -1568,48 +2753,30 @@ def main() -> None:
 
     with tabs[4]:
         st.subheader(TAB_ISSUES)
-        issues = data["order_status_by_item"].copy()
-        if COL_NOTE not in issues.columns:
-            st.info("\ud2b9\uc774\uc0ac\ud56d \ub370\uc774\ud130\uac00 \uc5c6\uc2b5\ub2c8\ub2e4.")
-            return
-        issues = issues[issues[COL_NOTE].notna()]
-        issues = issues[issues[COL_NOTE].astype(str).str.strip().ne("")]
-        if issues.empty:
+        issue_index = load_issue_view(
+            data.version or str(id(data)), file_stamp(ISSUE_TRACKER_PATH), data
+        )
+        if issue_index is None:
             st.info("\ud2b9\uc774\uc0ac\ud56d \ub370\uc774\ud130\uac00 \uc5c6\uc2b5\ub2c8\ub2e4.")
             return
 
-        base_cols = [COL_MONTH, COL_TYPE, COL_WORKNO, COL_CUSTOMER, COL_PRODUCT, COL_NOTE]
-        issues = issues[base_cols].drop_duplicates().copy()
-        issues[COL_ISSUE_KEY] = build_issue_key(issues)
-
-        tracker = load_issue_tracker(ISSUE_TRACKER_PATH)
-        merged = issues.merge(tracker, on=COL_ISSUE_KEY, how="left")
-        merged[COL_RESOLVED] = merged[COL_RESOLVED].fillna(False).astype(bool)
-        merged[COL_CLOSED_DATE] = pd.to_datetime(
-            merged[COL_CLOSED_DATE], errors="coerce"
-        ).dt.date
-        merged[COL_ISSUE_DATE] = pd.to_datetime(
-            merged[COL_ISSUE_DATE], errors="coerce"
-        ).dt.date
-
-        merged = add_search_column(merged)
         query = st.text_input(
             "\ud1b5\ud569 \uac80\uc0c9 (\ud2b9\uc774\uc0ac\ud56d \ubaa8\ub4e0 \ud56d\ubaa9\uc5d0\uc11c \uac80\uc0c9)",
             "",
             key="issue_search",
         )
-        merged = apply_search(merged, query).drop(columns=[SEARCH_COL], errors="ignore")
+        merged = apply_search(issue_index.frame, query, issue_index)
 
-        unresolved = merged[~merged[COL_RESOLVED]].copy()
-        resolved = merged[merged[COL_RESOLVED]].copy()
+        unresolved = merged[~merged[COL_RESOLVED]]
+        resolved = merged[merged[COL_RESOLVED]]
 
         st.caption(
             f"\ucd1d {len(merged):,}\uac74 \u00b7 \ubbf8\ud574\uacb0 {len(unresolved):,}\uac74 \u00b7 \uc885\uacb0 {len(resolved):,}\uac74"
         )
 
-        display_cols = base_cols + [COL_ISSUE_DATE, COL_RESOLVED, COL_CLOSED_DATE]
+        display_cols = ISSUE_BASE_COLUMNS + [COL_ISSUE_DATE, COL_RESOLVED, COL_CLOSED_DATE]
         st.markdown("**\ubbf8\ud574\uacb0 \uc548\uac74**")
-        editor_df = unresolved[display_cols].copy()
+        editor_df = unresolved[display_cols]
         if st.button("\uc804\uccb4 \ud574\uacb0", key="issue_resolve_all"):
             editor_df[COL_RESOLVED] = True
             editor_df[COL_CLOSED_DATE] = date.today()